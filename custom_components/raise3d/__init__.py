@@ -10,11 +10,17 @@ __all__ = (
     "async_migrate_entry",
     # Component methods
     "async_initialize_api_from_configuration",
+    "async_get_session",
+    "async_close_session",
     "async_fetch_device_info",
     "make_platform_async_setup_entry",
     "convert_unempty",
     "wrap_convert_unempty",
+    "convert_unempty_int",
+    "convert_unempty_float",
+    "resolve_api_method_name",
     # Component classes
+    "Raise3DRuntimeData",
     "Raise3DEntity",
     "Raise3DCoordinatorEntity",
     "Raise3DUpdateCoordinator",
@@ -32,23 +38,40 @@ __all__ = (
 )
 
 import asyncio
+import functools
 import logging
+import random
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Callable, final, Any, Mapping, Iterable, Awaitable, Generic, TypeVar
+from importlib import import_module
+from typing import (
+    Callable,
+    final,
+    Any,
+    Mapping,
+    Iterable,
+    Sequence,
+    Awaitable,
+    Generic,
+    TypeVar,
+)
 
 import aiohttp
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_CLOSE,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback, Event
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription, Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.entity_registry import (
     async_migrate_entries,
     RegistryEntry,
@@ -56,16 +79,16 @@ from homeassistant.helpers.entity_registry import (
     RegistryEntryHider,
 )
 from homeassistant.helpers.update_coordinator import (
-    DataUpdateCoordinator,
+    TimestampDataUpdateCoordinator,
     CoordinatorEntity,
 )
 
 from custom_components.raise3d.api import (
     Raise3DHostBasedStatefulAPI,
-    Raise3DAPIBase,
     APIDataResponse,
     Raise3DPrinterAPI,
     Raise3DStatefulAPI,
+    create_aiohttp_session,
 )
 from custom_components.raise3d.const import (
     DOMAIN,
@@ -74,10 +97,15 @@ from custom_components.raise3d.const import (
     CONF_PASSWORD,
     DEFAULT_MANUFACTURER,
     PLATFORMS,
+    BULK_UPDATE_GROUPS,
+    BULK_UPDATE_GROUP_MIN_INTERVALS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Kept apart from per-entry runtime data stored under DOMAIN
+_DATA_SESSION = f"{DOMAIN}_session"
+
 RAISE3D_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): cv.string,
@@ -93,42 +121,95 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+def _is_empty(value: Any) -> bool:
+    # Exact type check and isspace() avoid allocating a stripped copy
+    return value is None or (value.__class__ is str and (not value or value.isspace()))
+
+
 def convert_unempty(value: Any):
-    if isinstance(value, str) and not value.strip():
-        return None
-    return value
+    return None if _is_empty(value) else value
 
 
+@functools.lru_cache(maxsize=None)
 def wrap_convert_unempty(converter):
+    # Cached, so that descriptions sharing a converter share its wrapper
     def _wrapper(value: Any):
-        value = convert_unempty(value)
-        return None if value is None else converter(value)
+        return None if _is_empty(value) else converter(value)
 
     return _wrapper
 
 
+convert_unempty_int: Callable[[Any], int | None] = wrap_convert_unempty(int)
+convert_unempty_float: Callable[[Any], float | None] = wrap_convert_unempty(float)
+
+
+def resolve_api_method_name(method: str | Callable) -> str:
+    """Get name of an API method given either as a name or a function."""
+    if method.__class__ is str:
+        return method
+    return method.__name__
+
+
+_API_CALL_RETRIES = 2
+"""Retries performed for API calls interrupted by transient errors."""
+
+_API_CALL_RETRY_DELAY = 0.25
+"""Delay before the first retry, doubled for each subsequent one."""
+
+_API_CALL_MAX_RETRY_DELAY = 5.0
+"""Upper bound for a single retry delay."""
+
+_RECONCILE_REFRESH_DELAY = 2.0
+"""Delay after the latest write before its outcome is polled from the printer."""
+
+
+def _get_retry_after(exc: aiohttp.ClientResponseError) -> float | None:
+    try:
+        return float(exc.headers["Retry-After"])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
 async def _async_call_api_method(
-    __method: Callable[[Raise3DAPIBase], ...],
-    __logger: logging.Logger | logging.LoggerAdapter = _LOGGER,
+    method: Callable[..., Awaitable[Any]],
+    logger: logging.Logger | logging.LoggerAdapter = _LOGGER,
+    /,
     *args,
+    timeout: float | None = None,
+    idempotent: bool = True,
     **kwargs,
 ):
-    method_name = __method.__name__
-    try:
-        return await __method(*args, **kwargs)
-    except aiohttp.ServerDisconnectedError:
-        __logger.warning("Connection aborted while updating '%s'", method_name)
-    except aiohttp.ClientOSError as exc:
-        if exc.errno != 104:
-            raise
-        __logger.warning("Connection error while updating '%s'", method_name)
-    except aiohttp.ClientResponseError as exc:
-        if exc.status != 429:
-            raise
-        __logger.warning("Too many requests while updating '%s'", method_name)
-
-    await asyncio.sleep(1.5)
-    return await __method(*args, **kwargs)
+    # Writes interrupted by lost connections may have already been applied,
+    # hence only rejected ones (status 429) are retried for them.
+    max_delay = _API_CALL_MAX_RETRY_DELAY
+    if timeout is not None:
+        max_delay = min(max_delay, timeout / 2)
+
+    attempt = 0
+    while True:
+        delay = None
+        try:
+            return await asyncio.wait_for(method(*args, **kwargs), timeout)
+        except aiohttp.ServerDisconnectedError:
+            if not idempotent or attempt >= _API_CALL_RETRIES:
+                raise
+            logger.warning("Connection aborted while updating '%s'", method.__name__)
+        except aiohttp.ClientOSError as exc:
+            if not idempotent or exc.errno != 104 or attempt >= _API_CALL_RETRIES:
+                raise
+            logger.warning("Connection error while updating '%s'", method.__name__)
+        except aiohttp.ClientResponseError as exc:
+            if exc.status != 429 or attempt >= _API_CALL_RETRIES:
+                raise
+            logger.warning("Too many requests while updating '%s'", method.__name__)
+            delay = _get_retry_after(exc)
+
+        if delay is None:
+            # Exponential backoff with jitter
+            delay = _API_CALL_RETRY_DELAY * 2**attempt
+            delay += random.uniform(0, delay)
+        await asyncio.sleep(min(delay, max_delay))
+        attempt += 1
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -160,45 +241,194 @@ class Raise3DCoordinatorEntityDescription(Raise3DEntityDescription):
         super().__post_init__()
         if self.attribute is None:
             object.__setattr__(self, "attribute", self.key)
-        if isinstance(self.update_method_name, Callable):
-            object.__setattr__(
-                self, "update_method_name", self.update_method_name.__name__
-            )
+        object.__setattr__(
+            self,
+            "update_method_name",
+            resolve_api_method_name(self.update_method_name),
+        )
+
+
+@dataclass(slots=True)
+class Raise3DRuntimeData:
+    """Runtime data of a Raise3D configuration entry."""
 
+    api: Raise3DHostBasedStatefulAPI
+    """API instance bound to the printer."""
 
-class Raise3DUpdateCoordinator(DataUpdateCoordinator[APIDataResponse | None]):
-    """Raise3D Update Coordinator class."""
+    coordinators: dict[str, Raise3DUpdateCoordinator]
+    """Coordinators keyed by update group name."""
 
-    __slots__ = ("__update_method_name",)
+    device_info: DeviceInfo
+    """Device information fetched upon setup."""
 
-    def __init__(self, *args, update_method_name: str, **kwargs) -> None:
-        self.__update_method_name = update_method_name
+    update_interval: timedelta
+    """Interval between coordinator updates."""
+
+
+_UPDATE_GROUP_BY_METHOD_NAME: dict[str, str] = {
+    method_name: group_name
+    for group_name, method_names in BULK_UPDATE_GROUPS.items()
+    for method_name in method_names
+}
+
+
+class Raise3DUpdateCoordinator(
+    TimestampDataUpdateCoordinator[dict[str, APIDataResponse | None] | None]
+):
+    """Raise3D Update Coordinator class.
+
+    Polls a group of API methods at once, keying their responses by method name.
+    """
+
+    __slots__ = (
+        "__update_method_names",
+        "_bound_methods",
+        "_failing_method_names",
+        "_unsub_reconcile_refresh",
+    )
+
+    def __init__(self, *args, update_method_names: Iterable[str], **kwargs) -> None:
+        self.__update_method_names = tuple(update_method_names)
+        self._bound_methods: tuple[Callable[[], Awaitable[Any]], ...] | None = None
+        self._failing_method_names: set[str] = set()
+        self._unsub_reconcile_refresh: Callable[[], None] | None = None
         super().__init__(*args, **kwargs)
 
     @property
     def raise3d_api(self) -> Raise3DHostBasedStatefulAPI:
-        return self.hass.data[DOMAIN][self.config_entry.entry_id][0]
+        return self.hass.data[DOMAIN][self.config_entry.entry_id].api
 
     @final
     @property
-    def update_method_name(self) -> str:
-        return self.__update_method_name
+    def update_method_names(self) -> tuple[str, ...]:
+        return self.__update_method_names
 
     @final
-    async def _async_update_data(self) -> APIDataResponse | None:
+    async def _async_update_data(self) -> dict[str, APIDataResponse | None] | None:
         """Fetch the latest data from the source."""
-        try:
-            return await _async_call_api_method(
-                getattr(self.raise3d_api, self.update_method_name), self.logger
+        if (bound_methods := self._bound_methods) is None:
+            raise3d_api = self.raise3d_api
+            bound_methods = self._bound_methods = tuple(
+                getattr(raise3d_api, method_name)
+                for method_name in self.__update_method_names
             )
-        except aiohttp.ClientResponseError as exc:
-            if exc.status == 404:
+
+        # Entities listen within the context of their update method, hence
+        # methods of disabled entities are skipped instead of being polled.
+        listened_method_names = set(self.async_contexts())
+        polled_methods = tuple(
+            (method_name, method)
+            for method_name, method in zip(self.__update_method_names, bound_methods)
+            if method_name in listened_method_names
+        )
+
+        # Requests to all methods are issued concurrently over pooled connections
+        results = await asyncio.gather(
+            *(
+                _async_call_api_method(
+                    method,
+                    self.logger,
+                    timeout=self.update_interval.total_seconds(),
+                )
+                for _, method in polled_methods
+            ),
+            return_exceptions=True,
+        )
+
+        data = {}
+        unsupported_method_names = set()
+        error: BaseException | None = None
+        has_succeeded = False
+        for (method_name, _), result in zip(polled_methods, results):
+            if not isinstance(result, BaseException):
+                data[method_name] = result
+                has_succeeded = True
+                if method_name in self._failing_method_names:
+                    self._failing_method_names.discard(method_name)
+                    self.logger.info(f"Updates via '{method_name}' recovered")
+            elif isinstance(result, asyncio.CancelledError):
+                raise result
+            elif (
+                isinstance(result, aiohttp.ClientResponseError) and result.status == 404
+            ):
                 self.logger.warning(
-                    f"API does not support '{self.update_method_name}', stopping updater"
+                    f"API does not support '{method_name}', excluding from updates"
                 )
+                unsupported_method_names.add(method_name)
+            else:
+                # Only entities of the failed method become unavailable
+                if method_name in self._failing_method_names:
+                    self.logger.debug(f"Failed to update '{method_name}': {result!r}")
+                else:
+                    # Persistent failures are reported once, not on every poll
+                    self._failing_method_names.add(method_name)
+                    self.logger.warning(f"Failed to update '{method_name}': {result!r}")
+                data[method_name] = None
+                if error is None:
+                    error = result
+
+        if unsupported_method_names:
+            self.__update_method_names = tuple(
+                method_name
+                for method_name in self.__update_method_names
+                if method_name not in unsupported_method_names
+            )
+            self._bound_methods = None
+            if not self.__update_method_names:
+                self.logger.warning("No supported API methods left, stopping updater")
                 await self.async_shutdown()
+                self._async_detach()
                 return None
-            raise
+
+        if error is not None and not has_succeeded:
+            # Nothing could be updated, hence the group fails as a whole
+            raise error
+
+        return data
+
+    @callback
+    def _async_detach(self) -> None:
+        """Remove the coordinator from its configuration entry runtime data."""
+        if (
+            runtime_data := self.hass.data[DOMAIN].get(self.config_entry.entry_id)
+        ) is None:
+            return
+        coordinators = runtime_data.coordinators
+        for group_name, coordinator in tuple(coordinators.items()):
+            if coordinator is self:
+                del coordinators[group_name]
+
+    @callback
+    def async_set_optimistic_value(
+        self, method_name: str, attribute: str, value: Any
+    ) -> None:
+        """Replace a single value within current data and notify listeners."""
+        if (data := self.data) is None:
+            return
+        self.async_set_updated_data(
+            {**data, method_name: {**(data.get(method_name) or {}), attribute: value}}
+        )
+
+    @callback
+    def async_schedule_reconcile_refresh(self) -> None:
+        """Schedule a single refresh after the latest of consecutive writes."""
+        if self._unsub_reconcile_refresh is not None:
+            self._unsub_reconcile_refresh()
+        self._unsub_reconcile_refresh = async_call_later(
+            self.hass, _RECONCILE_REFRESH_DELAY, self._async_reconcile_refresh
+        )
+
+    async def _async_reconcile_refresh(self, *_) -> None:
+        self._unsub_reconcile_refresh = None
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and drop bound API methods."""
+        self._bound_methods = None
+        if self._unsub_reconcile_refresh is not None:
+            self._unsub_reconcile_refresh()
+            self._unsub_reconcile_refresh = None
+        await super().async_shutdown()
 
 
 _TRaise3DEntityDescription = TypeVar(
@@ -207,6 +437,8 @@ _TRaise3DEntityDescription = TypeVar(
 
 
 class BaseRaise3DEntity(Entity, Generic[_TRaise3DEntityDescription]):
+    __slots__ = ("entity_description", "logger", "_runtime")
+
     entity_description: _TRaise3DEntityDescription
 
     _attr_has_entity_name = True
@@ -215,43 +447,55 @@ class BaseRaise3DEntity(Entity, Generic[_TRaise3DEntityDescription]):
         self,
         entity_description: _TRaise3DEntityDescription,
         logger: logging.Logger | logging.LoggerAdapter = _LOGGER,
+        *,
+        runtime_data: Raise3DRuntimeData,
     ) -> None:
         self.entity_description = entity_description
         self.logger = logger
+        self._runtime = runtime_data
         self._attr_unique_id = (
             f"{self.config_entry.unique_id}__{entity_description.key}"
         )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return self.hass.data[DOMAIN][self.config_entry.entry_id][2]
+        self._attr_device_info = runtime_data.device_info
 
     @property
     def raise3d_api(self) -> Raise3DHostBasedStatefulAPI:
-        return self.hass.data[DOMAIN][self.config_entry.entry_id][0]
+        return self._runtime.api
 
     @property
     @abstractmethod
     def config_entry(self) -> ConfigEntry:
         raise NotImplementedError
 
-    async def async_call_method_by_name(self, method_name: str, *args, **kwargs):
+    async def async_call_method(
+        self, method: Callable[..., Awaitable[Any]], *args, **kwargs
+    ):
+        # Entities call methods to perform actions, which are not idempotent
         return await _async_call_api_method(
-            getattr(self.raise3d_api, method_name), self.logger, *args, **kwargs
+            method, self.logger, *args, idempotent=False, **kwargs
+        )
+
+    async def async_call_method_by_name(self, method_name: str, *args, **kwargs):
+        return await self.async_call_method(
+            getattr(self.raise3d_api, method_name), *args, **kwargs
         )
 
 
 class Raise3DEntity(
     BaseRaise3DEntity[_TRaise3DEntityDescription], Generic[_TRaise3DEntityDescription]
 ):
+    __slots__ = ("_config_entry",)
+
     def __init__(
         self,
         config_entry: ConfigEntry,
         entity_description: _TRaise3DEntityDescription,
         logger: logging.Logger | logging.LoggerAdapter = _LOGGER,
+        *,
+        runtime_data: Raise3DRuntimeData,
     ) -> None:
         self._config_entry = config_entry
-        super().__init__(entity_description, logger)
+        super().__init__(entity_description, logger, runtime_data=runtime_data)
 
     @property
     def config_entry(self) -> ConfigEntry:
@@ -270,6 +514,8 @@ class Raise3DCoordinatorEntity(
 ):
     """Raise3D Coordinator Entity class."""
 
+    __slots__ = ("_update_method_name", "_attribute", "_converter")
+
     def __init__(self, coordinator: Raise3DUpdateCoordinator, *args, **kwargs) -> None:
         """Initialize the sensor."""
         self._attr_native_value = None
@@ -277,18 +523,34 @@ class Raise3DCoordinatorEntity(
         CoordinatorEntity.__init__(self, coordinator)
         super().__init__(*args, **kwargs)
 
+        # Hoisted from the description, as these are read on every update
+        self._update_method_name = self.entity_description.update_method_name
+        self._attribute = self.entity_description.attribute
+        self._converter = self.entity_description.converter
+
+        # Coordinators only poll methods which are listened to
+        self.coordinator_context = self._update_method_name
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates, fetching data if the method was not polled yet."""
+        await super().async_added_to_hass()
+        if (
+            data := self.coordinator.data
+        ) is not None and self._update_method_name not in data:
+            await self.coordinator.async_request_refresh()
+
     @property
     def config_entry(self) -> ConfigEntry:
         return self.coordinator.config_entry
 
     @callback
     def _process_coordinator_data(self, data: APIDataResponse) -> None:
-        key = self.entity_description.attribute
-        value = data.get(key)
+        """Process data returned by the entity's update method."""
+        value = data.get(self._attribute)
         if value is not None:
-            self.logger.debug("%s=data[%s]=%s", self, key, value)
-            if self.entity_description.converter:
-                value = self.entity_description.converter(value)
+            self.logger.debug("%s=data[%s]=%s", self, self._attribute, value)
+            if (converter := self._converter) is not None:
+                value = converter(value)
             self._attr_native_value = value
         elif (
             self.entity_description.extrapolated_when_missing
@@ -307,9 +569,8 @@ class Raise3DCoordinatorEntity(
     def _handle_coordinator_update(self, write: bool = True) -> None:
         """Handle updated data from the coordinator."""
         data = self.coordinator.data
-        self._attr_device_info = self.hass.data[DOMAIN][
-            self.coordinator.config_entry.entry_id
-        ][2]
+        if data is not None:
+            data = data.get(self._update_method_name)
         self._attr_available = data is not None
 
         if self._attr_available:
@@ -321,27 +582,67 @@ class Raise3DCoordinatorEntity(
 # noinspection PyUnusedLocal
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Raise3D component."""
-    hass.data[DOMAIN] = {}
+    hass.data.setdefault(DOMAIN, {})
     return True
 
 
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Get session shared across all Raise3D API instances."""
+    session_data: tuple[aiohttp.ClientSession, CALLBACK_TYPE] | None
+    if (session_data := hass.data.get(_DATA_SESSION)) is not None:
+        return session_data[0]
+
+    session = create_aiohttp_session()
+
+    # noinspection PyUnusedLocal
+    async def _async_close_session(event: Event) -> None:
+        # Listener is removed by firing, hence unloading must not remove it
+        hass.data.pop(_DATA_SESSION, None)
+        await session.close()
+
+    hass.data[_DATA_SESSION] = (
+        session,
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session),
+    )
+    return session
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close session shared across all Raise3D API instances, if open."""
+    if (session_data := hass.data.pop(_DATA_SESSION, None)) is None:
+        return
+    session, unsub_close = session_data
+    unsub_close()
+    await session.close()
+
+
 @callback
 def async_get_coordinator(
     hass: HomeAssistant, entry: ConfigEntry, update_method_name: str
 ) -> Raise3DUpdateCoordinator:
-    # Iterate over the collected update_method_names
-    coordinators = hass.data[DOMAIN][entry.entry_id][1]
-    if update_method_name not in coordinators:
+    # Methods belonging to the same group share a single coordinator
+    group_name = _UPDATE_GROUP_BY_METHOD_NAME.get(
+        update_method_name, update_method_name
+    )
+    runtime_data = hass.data[DOMAIN][entry.entry_id]
+    coordinators = runtime_data.coordinators
+    if group_name not in coordinators:
+        update_interval = runtime_data.update_interval
+        if min_interval := BULK_UPDATE_GROUP_MIN_INTERVALS.get(group_name):
+            update_interval = max(update_interval, timedelta(seconds=min_interval))
         coordinator = Raise3DUpdateCoordinator(
             hass,
             _LOGGER,
             config_entry=entry,
-            name="Raise3D Updater for '{}' method".format(update_method_name),
-            update_interval=timedelta(seconds=entry.data[CONF_SCAN_INTERVAL]),
-            update_method_name=update_method_name,
+            name="Raise3D Updater for '{}' group".format(group_name),
+            update_interval=update_interval,
+            update_method_names=BULK_UPDATE_GROUPS.get(
+                group_name, (update_method_name,)
+            ),
         )
-        coordinators[update_method_name] = coordinator
-    return coordinators[update_method_name]
+        coordinators[group_name] = coordinator
+    return coordinators[group_name]
 
 
 async def async_fetch_device_info(raise3d_api: Raise3DPrinterAPI):
@@ -374,12 +675,28 @@ async def async_initialize_api_from_configuration(
         host=data[CONF_HOST],
         printer_port=data[CONF_PORT],
         printer_password=data[CONF_PASSWORD],
-        session=async_get_clientsession(hass, verify_ssl=True),
+        session=async_get_session(hass),
     )
     await raise3d_api.login()
     return raise3d_api
 
 
+@functools.lru_cache(maxsize=None)
+def _get_entity_descriptions_index() -> (
+    tuple[tuple[str, Raise3DEntityDescription], ...]
+):
+    # Platform modules import from this package, hence they are loaded lazily
+    return tuple(
+        (entity_platform, entity_description)
+        for entity_platform in PLATFORMS
+        for entity_description in getattr(
+            import_module(f"custom_components.raise3d.{entity_platform}"),
+            "ENTITY_DESCRIPTIONS",
+            (),
+        )
+    )
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     from custom_components.raise3d.config_flow import Raise3DFlowHandler
@@ -429,53 +746,35 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
                 )
             )
 
-            def _collect_entity_keys():
-                from importlib import import_module
-
-                renamed_unique_ids_ = {}
-                for entity_platform in PLATFORMS:
-                    module = import_module(
-                        f"custom_components.raise3d.{entity_platform}"
-                    )
-                    # Collect update_method_names if ENTITY_DESCRIPTIONS is present
-                    for entity_description in getattr(
-                        module, "ENTITY_DESCRIPTIONS", ()
-                    ):
-                        old_unique_id = (
-                            f"{data[CONF_NAME]}_data_{entity_description.key}"
-                        )
-                        new_unique_id_ = (
-                            f"{config_entry.unique_id}__{entity_description.key}"
-                        )
-                        renamed_unique_ids_[old_unique_id] = (
-                            entity_platform,
-                            new_unique_id_,
-                        )
-                return renamed_unique_ids_
-
-            # noinspection PyTypeChecker
-            renamed_unique_ids = await hass.async_add_executor_job(_collect_entity_keys)
+            # Platform modules may not be loaded yet, hence import off-loop
+            entity_descriptions_index = await hass.async_add_executor_job(
+                _get_entity_descriptions_index
+            )
+            renamed_unique_ids = {
+                f"{data[CONF_NAME]}_data_{entity_description.key}": (
+                    entity_platform,
+                    f"{config_entry.unique_id}__{entity_description.key}",
+                )
+                for entity_platform, entity_description in entity_descriptions_index
+            }
 
             def _refactor_unique_ids(
                 entry_data: RegistryEntry,
             ) -> dict[str, Any] | None:
-                try:
-                    entity_platform, new_unique_id_ = renamed_unique_ids[
-                        entry_data.unique_id
-                    ]
-                except KeyError:
+                if (renamed := renamed_unique_ids.get(entry_data.unique_id)) is None:
                     return None
-                else:
-                    # For entities whose platforms sustained, update unique id.
-                    if entity_platform == entry_data.platform:
-                        return {"new_unique_id": new_unique_id_}
+                entity_platform, new_unique_id_ = renamed
+
+                # For entities whose platforms sustained, update unique id.
+                if entity_platform == entry_data.platform:
+                    return {"new_unique_id": new_unique_id_}
 
-                    # For entities whose platforms migrated, disable and hide.
-                    return {
-                        "new_unique_id": new_unique_id_ + "__obsolete",
-                        "disabled_by": RegistryEntryDisabler.INTEGRATION,
-                        "hidden_by": RegistryEntryHider.INTEGRATION,
-                    }
+                # For entities whose platforms migrated, disable and hide.
+                return {
+                    "new_unique_id": new_unique_id_ + "__obsolete",
+                    "disabled_by": RegistryEntryDisabler.INTEGRATION,
+                    "hidden_by": RegistryEntryHider.INTEGRATION,
+                }
 
             await async_migrate_entries(
                 hass, config_entry.entry_id, _refactor_unique_ids
@@ -516,60 +815,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinators: dict[str, Raise3DUpdateCoordinator] = {}
 
     # Store data for future use
-    hass.data[DOMAIN][entry.entry_id] = (raise3d_api, coordinators, device_info_data)
+    hass.data[DOMAIN][entry.entry_id] = Raise3DRuntimeData(
+        api=raise3d_api,
+        coordinators=coordinators,
+        device_info=device_info_data,
+        update_interval=timedelta(seconds=entry.data[CONF_SCAN_INTERVAL]),
+    )
 
     # up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Perform first config entry refresh
-    coordinator_refresh_tasks = {
-        coordinator: hass.async_create_task(
+    first_refresh_coordinators = tuple(coordinators.values())
+    results = await asyncio.gather(
+        *(
             coordinator.async_config_entry_first_refresh()
-        )
-        for coordinator in coordinators.values()
-    }
-    if coordinator_refresh_tasks:
-        await asyncio.wait(
-            coordinator_refresh_tasks.values(), return_when=asyncio.ALL_COMPLETED
-        )
-        for coordinator, task in coordinator_refresh_tasks.items():
-            exc = task.exception()
-            if exc and not isinstance(exc, asyncio.CancelledError):
-                logger_kwargs = {}
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    logger_kwargs["exc_info"] = exc
-                _LOGGER.error(
-                    "Error during first refresh via '%s': %s",
-                    coordinator.update_method_name,
-                    exc,
-                    **logger_kwargs,
-                )
+            for coordinator in first_refresh_coordinators
+        ),
+        return_exceptions=True,
+    )
+    for coordinator, exc in zip(first_refresh_coordinators, results):
+        if isinstance(exc, BaseException) and not isinstance(
+            exc, asyncio.CancelledError
+        ):
+            logger_kwargs = {}
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                logger_kwargs["exc_info"] = exc
+            _LOGGER.error(
+                "Error during first refresh via '%s': %s",
+                "', '".join(coordinator.update_method_names),
+                exc,
+                **logger_kwargs,
+            )
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry):
     """Unload Raise3D entry."""
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, component)
-                for component in PLATFORMS
-            ]
-        )
-    )
-    if not unload_ok:
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         return False
 
     hass.data[DOMAIN].pop(entry.entry_id)
+
+    # Last unloaded entry releases pooled connections
+    if not hass.data[DOMAIN]:
+        await async_close_session(hass)
+
     return True
 
 
 def make_platform_async_setup_entry(
-    entity_descriptions: Iterable[Raise3DEntityDescription],
+    entity_descriptions: Sequence[Raise3DEntityDescription],
     platform_class: type[BaseRaise3DEntity],
     logger: logging.Logger | logging.LoggerAdapter = _LOGGER,
 ) -> Callable[[HomeAssistant, ConfigEntry, AddEntitiesCallback], Awaitable[bool]]:
+    # Platform class does not change, hence it is checked once
+    if issubclass(platform_class, Raise3DCoordinatorEntity):
+        is_coordinator_platform = True
+    elif issubclass(platform_class, Raise3DEntity):
+        is_coordinator_platform = False
+    else:
+        raise ValueError("invalid platform_class: {}".format(platform_class))
+
+    # Descriptions sharing an update method share a coordinator
+    update_method_names = (
+        tuple(
+            dict.fromkeys(
+                entity_description.update_method_name
+                for entity_description in entity_descriptions
+            )
+        )
+        if is_coordinator_platform
+        else ()
+    )
+
     # noinspection PyShadowingNames
     async def async_setup_entry(
         hass: HomeAssistant,
@@ -577,27 +897,34 @@ def make_platform_async_setup_entry(
         async_add_entities: AddEntitiesCallback,
     ) -> bool:
         """Do the setup entry."""
-        entities = []
-
-        for entity_description in entity_descriptions:
-            if issubclass(platform_class, Raise3DCoordinatorEntity):
-                # noinspection PyArgumentList,PyUnresolvedReferences
-                sensor = platform_class(
-                    coordinator=async_get_coordinator(
-                        hass, entry, entity_description.update_method_name
-                    ),
+        runtime_data = hass.data[DOMAIN][entry.entry_id]
+
+        if is_coordinator_platform:
+            # Coordinators are resolved once per method, entities keep their order
+            coordinators = {
+                method_name: async_get_coordinator(hass, entry, method_name)
+                for method_name in update_method_names
+            }
+            # noinspection PyArgumentList,PyUnresolvedReferences
+            entities = [
+                platform_class(
+                    coordinator=coordinators[entity_description.update_method_name],
                     entity_description=entity_description,
+                    runtime_data=runtime_data,
                 )
-            elif issubclass(platform_class, Raise3DEntity):
-                # noinspection PyArgumentList
-                sensor = platform_class(
+                for entity_description in entity_descriptions
+            ]
+        else:
+            # noinspection PyArgumentList
+            entities = [
+                platform_class(
                     config_entry=entry,
                     entity_description=entity_description,
                     logger=logger,
+                    runtime_data=runtime_data,
                 )
-            else:
-                raise ValueError("invalid platform_class: {}".format(platform_class))
-            entities.append(sensor)
+                for entity_description in entity_descriptions
+            ]
 
         logger.debug("Entities added : %i", len(entities))
 
@@ -1,15 +1,18 @@
+import asyncio
 import hashlib
 import logging
 import posixpath
+import sys
 import time
 import urllib.parse
 from abc import ABC
 from datetime import datetime
+from enum import StrEnum
 from ipaddress import IPv4Address
 from typing import Literal, Final, final, Any
 
 import aiohttp
-from aenum import StrEnum
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,15 +21,69 @@ DEFAULT_PRINTER_PORT: Final[int] = 10800
 DEFAULT_CAMERA_PORT: Final[int] = 30
 APIDataResponse = dict[str, Any]
 
+_JSON_HEADERS: Final[dict[str, str]] = {aiohttp.hdrs.CONTENT_TYPE: "application/json"}
+
+DEFAULT_CACHE_TTL: Final[float] = 2.0
+"""Seconds during which GET responses are served from cache."""
+
+# Assumed lifetime; the printer API does not document token expiry. Renewal
+# on 401 responses remains authoritative when tokens expire any sooner.
+DEFAULT_TOKEN_TTL: Final[float] = 1800.0
+"""Seconds after which authentication tokens are renewed ahead of requests."""
+
+_TOKEN_RENEW_MARGIN: Final[float] = 30.0
+"""Seconds before token expiry when renewal is already performed."""
+
+_CURSOR_PARAMS: Final[frozenset[str]] = frozenset(("start_pos", "pos"))
+"""Parameters denoting paginated requests, which are never cached."""
+
+# Cleanup of closed SSL transports is only needed on Python versions where
+# they may leak; newer aiohttp versions warn when it is enabled needlessly.
+ENABLE_CLEANUP_CLOSED: Final[bool] = sys.version_info < (3, 12, 7) or (
+    (3, 13, 0) <= sys.version_info < (3, 13, 1)
+)
+
 
 async def on_request_start(session, context, params):
     logging.getLogger("aiohttp.client").debug("Starting request <%s>", params)
 
 
+def _copy_response(response_data: Any) -> Any:
+    """Copy top level of a response shared between multiple callers.
+
+    Nested values remain shared, hence callers must not mutate them.
+    """
+    if isinstance(response_data, (dict, list)):
+        return response_data.copy()
+    return response_data
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
 def create_aiohttp_session():
     trace_config = aiohttp.TraceConfig()
     trace_config.on_request_start.append(on_request_start)
-    return aiohttp.ClientSession(trace_configs=[trace_config])
+    # Keep connections to the printer alive between polls, so that
+    # subsequent requests skip the connection handshake entirely. Printer
+    # addresses rarely change, so they are only resolved once in a while.
+    # The session is shared by all printers and also proxies long-lived
+    # camera streams, hence only connections per endpoint are limited.
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=8,
+        keepalive_timeout=120,
+        force_close=False,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        enable_cleanup_closed=ENABLE_CLEANUP_CLOSED,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        json_serialize=_orjson_dumps,
+        trace_configs=[trace_config],
+    )
 
 
 class APIResponseError(aiohttp.ClientResponseError):
@@ -55,8 +112,24 @@ class JobStatusValue(StrEnum):
     STOPPED = "stopped"
 
 
+class SignAlgorithmValue(StrEnum):
+    LEGACY_MD5_SHA1 = "legacy_md5_sha1"
+    SHA256 = "sha256"
+
+
+def _new_sign_hash_base(
+    password: str,
+    algorithm: SignAlgorithmValue = SignAlgorithmValue.LEGACY_MD5_SHA1,
+):
+    """Create hash object already fed with the password part of the payload."""
+    return hashlib.new(
+        "sha256" if algorithm == SignAlgorithmValue.SHA256 else "sha1",
+        f"password={password}&timestamp=".encode(),
+    )
+
+
 class Raise3DAPIBase(ABC):
-    __slots__ = ("_session", "logger")
+    __slots__ = ("_session", "_owns_session", "logger")
 
     def __init__(
         self,
@@ -65,6 +138,7 @@ class Raise3DAPIBase(ABC):
         *args,
         **kwargs,
     ) -> None:
+        self._owns_session = session is None
         self._session = session or create_aiohttp_session()
         self.logger = logger
 
@@ -73,7 +147,9 @@ class Raise3DAPIBase(ABC):
         return self._session
 
     async def close(self) -> None:
-        await self._session.close()
+        # Externally provided sessions are closed by their owners
+        if self._owns_session:
+            await self._session.close()
 
 
 class Raise3DCameraAPI(Raise3DAPIBase):
@@ -85,17 +161,74 @@ class Raise3DCameraAPI(Raise3DAPIBase):
         camera_password: str | None = None,
         **kwargs,
     ) -> None:
+        # Setters below only store changed values, so defaults must exist
+        self._camera_url: str | None = None
+        self._camera_username: str | None = None
+        self._camera_password: str | None = None
+        self._camera_auth_headers: dict[str, str] | None = None
+        self._invalidate_camera_urls()
         self.camera_url = camera_url
         self.camera_username = camera_username
         self.camera_password = camera_password
         super().__init__(*args, **kwargs)
 
+    def _invalidate_camera_urls(self) -> None:
+        self._camera_request_urls: dict[str, str] = {}
+        self._camera_bare_stream_url: str | None = None
+        self._camera_stream_url: str | None = None
+
+    def _update_camera_auth_headers(self) -> None:
+        # Encoded once per credentials change instead of on every request
+        if (username := self._camera_username) is None:
+            self._camera_auth_headers = None
+            return
+        password = self._camera_password or ""
+        self._camera_auth_headers = {
+            aiohttp.hdrs.AUTHORIZATION: aiohttp.BasicAuth(username, password).encode()
+        }
+
+    @property
+    def camera_url(self) -> str:
+        return self._camera_url
+
+    @camera_url.setter
+    def camera_url(self, camera_url: str) -> None:
+        if getattr(self, "_camera_url", None) != camera_url:
+            self._camera_url = camera_url
+            self._invalidate_camera_urls()
+
+    @property
+    def camera_username(self) -> str | None:
+        return self._camera_username
+
+    @camera_username.setter
+    def camera_username(self, camera_username: str | None) -> None:
+        if getattr(self, "_camera_username", None) != camera_username:
+            self._camera_username = camera_username
+            self._invalidate_camera_urls()
+            self._update_camera_auth_headers()
+
+    @property
+    def camera_password(self) -> str | None:
+        return self._camera_password
+
+    @camera_password.setter
+    def camera_password(self, camera_password: str | None) -> None:
+        if getattr(self, "_camera_password", None) != camera_password:
+            self._camera_password = camera_password
+            self._invalidate_camera_urls()
+            self._update_camera_auth_headers()
+
     def ctx_camera_request(self, action: str):
-        api_path = posixpath.join("api", "v1", "camera", action)
+        if (url := self._camera_request_urls.get(action)) is None:
+            api_path = posixpath.join("api", "v1", "camera", action)
+            url = self._camera_request_urls[action] = urllib.parse.urljoin(
+                self.camera_url, api_path
+            )
         return self.session.request(
             aiohttp.hdrs.METH_GET,
-            urllib.parse.urljoin(self.camera_url, api_path),
-            auth=aiohttp.BasicAuth(self.camera_username, self.camera_password),
+            url,
+            headers=self._camera_auth_headers,
         )
 
     async def get_snapshot(self) -> bytes:
@@ -104,7 +237,7 @@ class Raise3DCameraAPI(Raise3DAPIBase):
 
     async def get_state(self) -> APIDataResponse:
         async with self.ctx_camera_request("state") as request:
-            return await request.json()
+            return await request.json(loads=orjson.loads)
 
     async def check_auth(self) -> bool:
         async with self.ctx_camera_request("auth_stream") as request:
@@ -112,8 +245,10 @@ class Raise3DCameraAPI(Raise3DAPIBase):
 
     @property
     def camera_bare_stream_url(self) -> str:
+        if (stream_url := self._camera_bare_stream_url) is not None:
+            return stream_url
         parsed_url = urllib.parse.urlparse(self.camera_url)
-        return urllib.parse.urlunparse(
+        stream_url = self._camera_bare_stream_url = urllib.parse.urlunparse(
             (
                 parsed_url.scheme,
                 parsed_url.netloc,
@@ -123,11 +258,17 @@ class Raise3DCameraAPI(Raise3DAPIBase):
                 "",
             )
         )
+        return stream_url
 
     @property
-    def camera_stream_url(self) -> str:
+    def camera_stream_url(self) -> str | None:
+        if (stream_url := self._camera_stream_url) is not None:
+            return stream_url
+        if self.camera_username is None:
+            # Credentials are unknown until camera information is fetched
+            return None
         parsed_url = urllib.parse.urlparse(self.camera_url)
-        return urllib.parse.urlunparse(
+        stream_url = self._camera_stream_url = urllib.parse.urlunparse(
             (
                 parsed_url.scheme,
                 urllib.parse.quote(self.camera_username, safe="")
@@ -141,33 +282,80 @@ class Raise3DCameraAPI(Raise3DAPIBase):
                 "",
             )
         )
+        return stream_url
 
 
 class Raise3DPrinterAPI(Raise3DAPIBase):
     def __init__(
-        self, *args, printer_url: str, printer_token: str | None = None, **kwargs
+        self,
+        *args,
+        printer_url: str,
+        printer_token: str | None = None,
+        sign_algo: SignAlgorithmValue = SignAlgorithmValue.LEGACY_MD5_SHA1,
+        coalesce_gets: bool = True,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        **kwargs,
     ) -> None:
         self.printer_url = printer_url
         self.printer_token = printer_token
+        self.sign_algo = sign_algo
+        self.coalesce_gets = coalesce_gets
+        self.cache_ttl = cache_ttl
+        self._inflight_requests: dict[tuple, asyncio.Future] = {}
+        self._response_cache: dict[tuple, tuple[float, APIDataResponse]] = {}
+        self._cache_generation = 0
         super().__init__(*args, **kwargs)
 
+    @property
+    def printer_url(self) -> str:
+        return self._printer_url
+
+    @printer_url.setter
+    def printer_url(self, printer_url: str) -> None:
+        self._printer_url = printer_url
+        self._printer_request_urls: dict[str, str] = {}
+
+    @property
+    def printer_token(self) -> str | None:
+        return self._printer_token
+
+    @printer_token.setter
+    def printer_token(self, printer_token: str | None) -> None:
+        self._printer_token = printer_token
+        # Shared by all authenticated requests without extra parameters
+        self._auth_params: dict[str, str] = {"token": printer_token}
+
     @staticmethod
     def generate_sign(
-        password, timestamp: int | datetime | None = None
+        password,
+        timestamp: int | datetime | None = None,
+        algorithm: SignAlgorithmValue = SignAlgorithmValue.LEGACY_MD5_SHA1,
+        *,
+        hash_base=None,
     ) -> tuple[str, int]:
+        """Generate login signature.
+
+        A hash object pre-fed with the password (see `_new_sign_hash_base`)
+        may be provided to skip hashing the password part again.
+        """
         if timestamp is None:
             timestamp = time.time()
         elif isinstance(timestamp, datetime):
             timestamp = timestamp.timestamp()
         if isinstance(timestamp, float):
             timestamp = int(timestamp * 1000)
-        else:
+        elif not isinstance(timestamp, int):
             raise ValueError("invalid timestamp argument")
 
-        sha1_hash = hashlib.sha1(
-            f"password={password}&timestamp={timestamp}".encode()
-        ).hexdigest()
-        sign = hashlib.md5(sha1_hash.encode()).hexdigest()
+        if hash_base is None:
+            sign_hash = _new_sign_hash_base(password, algorithm)
+        else:
+            sign_hash = hash_base.copy()
+        sign_hash.update(str(timestamp).encode())
+        if algorithm == SignAlgorithmValue.SHA256:
+            return sign_hash.hexdigest(), timestamp
+
+        sign = hashlib.md5(sign_hash.hexdigest().encode()).hexdigest()
         return sign, timestamp
 
     # noinspection PyTypeHints
@@ -179,23 +367,128 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
         json: dict | None = None,
         data=None,
         auth: bool = True,
+    ) -> APIDataResponse:
+        if method != aiohttp.hdrs.METH_GET:
+            # Reads started before the write must not be reused after it
+            self.invalidate()
+            try:
+                return await self._printer_request(
+                    method, endpoint, params, json, data, auth
+                )
+            finally:
+                # Any write may change what subsequent reads return
+                self.invalidate()
+
+        key = (endpoint, auth, frozenset(params.items()) if params else None)
+        cacheable = (
+            self.cache_ttl
+            and auth
+            and (not params or _CURSOR_PARAMS.isdisjoint(params))
+        )
+        if cacheable and (cached := self._response_cache.get(key)) is not None:
+            if cached[0] > time.monotonic():
+                return _copy_response(cached[1])
+            del self._response_cache[key]
+
+        generation = self._cache_generation
+        if not self.coalesce_gets:
+            response_data = await self._printer_request(
+                method, endpoint, params, json, data, auth
+            )
+        else:
+            response_data = await self._coalesced_printer_request(
+                key, method, endpoint, params, json, data, auth
+            )
+
+        # Responses requested before an invalidation may already be outdated
+        if cacheable and generation == self._cache_generation:
+            now = time.monotonic()
+            # Drop expired responses, as many keys are never requested again
+            for expired_key in [
+                cached_key
+                for cached_key, (expires_at, _) in self._response_cache.items()
+                if expires_at <= now
+            ]:
+                del self._response_cache[expired_key]
+            self._response_cache[key] = (now + self.cache_ttl, response_data)
+
+        # Responses may be shared with other callers and the cache
+        return _copy_response(response_data)
+
+    def invalidate(self, endpoint_prefix: str = "") -> None:
+        """Drop cached GET responses of endpoints starting with the prefix.
+
+        GET requests in flight are detached as well, so that their responses
+        are neither cached nor shared with requests issued afterwards.
+        """
+        self._cache_generation += 1
+        if not endpoint_prefix:
+            self._response_cache.clear()
+            self._inflight_requests.clear()
+            return
+        for requests in (self._response_cache, self._inflight_requests):
+            for key in tuple(requests):
+                if key[0].startswith(endpoint_prefix):
+                    del requests[key]
+
+    async def _coalesced_printer_request(self, key: tuple, *args) -> APIDataResponse:
+        # Identical GET requests issued while one is in flight share its result
+        if (task := self._inflight_requests.get(key)) is None:
+            task = self._inflight_requests[key] = asyncio.ensure_future(
+                self._printer_request(*args)
+            )
+
+            def _on_done(done_task: asyncio.Future) -> None:
+                if self._inflight_requests.get(key) is done_task:
+                    del self._inflight_requests[key]
+                if not done_task.cancelled():
+                    # Mark exception as retrieved in case all waiters are gone
+                    done_task.exception()
+
+            task.add_done_callback(_on_done)
+
+        # Cancelling one waiter must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    # noinspection PyTypeHints
+    async def _printer_request(
+        self,
+        method: Literal[aiohttp.hdrs.METH_GET, aiohttp.hdrs.METH_POST],
+        endpoint,
+        params: dict | None = None,
+        json: dict | None = None,
+        data=None,
+        auth: bool = True,
     ) -> APIDataResponse:
         if self._session.closed:
             raise RuntimeError("Client session is closed!")
         if auth and not self.printer_token:
             raise ValueError("Authentication token is required for this API call.")
 
-        url = f"{self.printer_url}{endpoint}"
-        pass_params = {}
-        if auth:
-            pass_params["token"] = self.printer_token
-        if params:
-            pass_params.update(params)
+        if (url := self._printer_request_urls.get(endpoint)) is None:
+            url = self._printer_request_urls[endpoint] = f"{self.printer_url}{endpoint}"
+        if not params:
+            pass_params = self._auth_params if auth else None
+        elif auth:
+            pass_params = {**self._auth_params, **params}
+        else:
+            pass_params = params
+
+        headers = None
+        if json is not None:
+            # Serialize here, so that the session's serializer is irrelevant
+            data = orjson.dumps(json)
+            headers = _JSON_HEADERS
 
         async with self.session.request(
-            method, url, json=json, data=data, params=pass_params, raise_for_status=True
+            method,
+            url,
+            data=data,
+            params=pass_params,
+            headers=headers,
+            raise_for_status=True,
         ) as response:
-            response_data = await response.json()
+            response_data = await response.json(loads=orjson.loads)
             self.logger.debug(f"'{url}' JSON response: {response_data}")
             if response.status == 200 and response_data.get("status") == 1:
                 return response_data.get("data")
@@ -214,13 +507,10 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
                 headers=response.headers,
             )
 
-    async def _prv1(self, method: str, url: str, *args, **kwargs) -> APIDataResponse:
-        return await self.printer_request(method, "/v1" + url, *args, **kwargs)
-
     async def login(self, sign: str, timestamp: int, **kwargs) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_GET,
-            "/login",
+            "/v1/login",
             params={"sign": sign, "timestamp": timestamp},
             auth=False,
             **kwargs,
@@ -228,71 +518,79 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
 
     # Printer state and statistics
     async def get_system_info(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/printer/system")
+        return await self.printer_request(aiohttp.hdrs.METH_GET, "/v1/printer/system")
 
     async def get_camera_info(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/printer/camera")
+        return await self.printer_request(aiohttp.hdrs.METH_GET, "/v1/printer/camera")
 
     async def get_running_status(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/printer/runningstatus")
+        return await self.printer_request(
+            aiohttp.hdrs.METH_GET, "/v1/printer/runningstatus"
+        )
 
     async def get_basic_info(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/printer/basic")
+        return await self.printer_request(aiohttp.hdrs.METH_GET, "/v1/printer/basic")
 
     async def get_statistics(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/dashboard/statistics")
+        return await self.printer_request(
+            aiohttp.hdrs.METH_GET, "/v1/dashboard/statistics"
+        )
 
     # Nozzle control
     async def get_left_nozzle_info(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/printer/nozzle1")
+        return await self.printer_request(aiohttp.hdrs.METH_GET, "/v1/printer/nozzle1")
 
     async def get_right_nozzle_info(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/printer/nozzle2")
+        return await self.printer_request(aiohttp.hdrs.METH_GET, "/v1/printer/nozzle2")
 
     async def set_left_nozzle_temp(self, temperature: int) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/printer/nozzle1/temp/set",
+            "/v1/printer/nozzle1/temp/set",
             json={"temperature": temperature},
         )
 
     async def set_right_nozzle_temp(self, temperature: int) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/printer/nozzle2/temp/set",
+            "/v1/printer/nozzle2/temp/set",
             json={"temperature": temperature},
         )
 
     async def set_left_nozzle_flowrate(self, flowrate: int) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/printer/nozzle1/flowrate/set",
+            "/v1/printer/nozzle1/flowrate/set",
             json={"flowrate": flowrate},
         )
 
     async def set_right_nozzle_flowrate(self, flowrate: int) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/printer/nozzle2/flowrate/set",
+            "/v1/printer/nozzle2/flowrate/set",
             json={"flowrate": flowrate},
         )
 
     async def set_heatbed_temp(self, temperature: int) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/printer/heatbedtemp/set",
+            "/v1/printer/heatbedtemp/set",
             json={"temperature": temperature},
         )
 
     async def set_feedrate(self, feedrate: int) -> APIDataResponse:
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/printer/feedrate/set", json={"feedrate": feedrate}
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST,
+            "/v1/printer/feedrate/set",
+            json={"feedrate": feedrate},
         )
 
     # Printer control
     async def set_fan_speed(self, fanspeed: int) -> APIDataResponse:
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/printer/fanspeed/set", json={"fanspeed": fanspeed}
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST,
+            "/v1/printer/fanspeed/set",
+            json={"fanspeed": fanspeed},
         )
 
     async def axis_control(
@@ -305,21 +603,21 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
         feed: int | None = None,
         nozzle: int | None = None,
     ) -> APIDataResponse:
-        params = {"is_relative_pos": int(is_relative_pos)}
-        if x is not None:
-            params["x"] = x
-        if y is not None:
-            params["y"] = y
-        if z is not None:
-            params["z"] = z
-        if e is not None:
-            params["e"] = e
-        if nozzle is not None:
-            params["nozzle"] = nozzle
-        if feed is not None:
-            params["feed"] = feed
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/printer/axiscontrol/set", json=params
+        params = {
+            key: value
+            for key, value in (
+                ("is_relative_pos", int(is_relative_pos)),
+                ("x", x),
+                ("y", y),
+                ("z", z),
+                ("e", e),
+                ("nozzle", nozzle),
+                ("feed", feed),
+            )
+            if value is not None
+        }
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST, "/v1/printer/axiscontrol/set", json=params
         )
 
     async def move_home(self) -> APIDataResponse:
@@ -327,62 +625,64 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
 
     # File positioning operations
     async def move_file(self, file_src: str, file_dst: str) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/filepos/moveto",
+            "/v1/filepos/moveto",
             data={"file_src": file_src, "file_dst": file_dst},
         )
 
     async def copy_file(self, file_src: str, file_dst: str) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/filepos/copy",
+            "/v1/filepos/copy",
             data={"file_src": file_src, "file_dst": file_dst},
         )
 
     async def rename_file(self, file_path: str, new_name: str) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/filepos/rename",
+            "/v1/filepos/rename",
             data={"file_path": file_path, "new_name": new_name},
         )
 
     async def delete_file(self, file_path: str) -> APIDataResponse:
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/filepos/delete", params={"data_path": file_path}
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST,
+            "/v1/filepos/delete",
+            params={"data_path": file_path},
         )
 
     # Job management operations
     async def get_current_job(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_GET, "/job/currentjob")
+        return await self.printer_request(aiohttp.hdrs.METH_GET, "/v1/job/currentjob")
 
     async def set_current_job(
         self, operate: Literal["pause", "resume", "stop"]
     ) -> APIDataResponse:
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/job/currentjob", params={"operate": operate}
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST, "/v1/job/currentjob", params={"operate": operate}
         )
 
     async def create_job(self, file_path: str) -> APIDataResponse:
         # @TODO: param may be named 'filepath'
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/job/create", params={"file_path": file_path}
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST, "/v1/job/create", params={"file_path": file_path}
         )
 
     async def recover_last_job(self) -> APIDataResponse:
-        return await self._prv1(aiohttp.hdrs.METH_POST, "/job/recover/set")
+        return await self.printer_request(aiohttp.hdrs.METH_POST, "/v1/job/recover/set")
 
     async def list_jobs(self, start_pos: int = 0, max_num: int = 24) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_GET,
-            "/dashboard/job",
+            "/v1/dashboard/job",
             params={"start_pos": start_pos, "max_num": max_num},
         )
 
     async def get_job(self, job_id: str, pos: int) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_GET,
-            "/dashboard/job",
+            "/v1/dashboard/job",
             params={"job_id": job_id, "pos": pos},
         )
 
@@ -396,28 +696,32 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
             height = width or 32
         if width is None:
             width = height
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_GET,
-            "/dashboard/imagedownload",
+            "/v1/dashboard/imagedownload",
             params={"job_id": job_id, "width": width, "height": height},
         )
 
     # Directory positioning operations
     async def create_directory(self, dir_path: str) -> APIDataResponse:
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/filepos/dir/create", data={"dir_path": dir_path}
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST,
+            "/v1/filepos/dir/create",
+            data={"dir_path": dir_path},
         )
 
     async def rename_directory(self, dir_path: str, new_name: str) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_POST,
-            "/filepos/dir/rename",
+            "/v1/filepos/dir/rename",
             data={"dir_path": dir_path, "new_name": new_name},
         )
 
     async def delete_directory(self, dir_path: str) -> APIDataResponse:
-        return await self._prv1(
-            aiohttp.hdrs.METH_POST, "/filepos/dir/delete", params={"dir_path": dir_path}
+        return await self.printer_request(
+            aiohttp.hdrs.METH_POST,
+            "/v1/filepos/dir/delete",
+            params={"dir_path": dir_path},
         )
 
     # Content handling operations
@@ -425,8 +729,14 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
         self, file_path: str, destination_path: str
     ) -> APIDataResponse:
         dir_path, _, filename = destination_path.rpartition("/")
-        with aiohttp.MultipartWriter("form-data") as mp:
-            with open(file_path, "rb") as file:
+        # Opening may block on slow storage, while aiohttp itself streams the
+        # file payload in chunks read within the executor, and derives the
+        # content length from the file size.
+        file = await asyncio.get_running_loop().run_in_executor(
+            None, open, file_path, "rb"
+        )
+        try:
+            with aiohttp.MultipartWriter("form-data") as mp:
                 # first, desc part
                 part = mp.append_json({"dir_path": dir_path})
                 part.set_content_disposition("form-data", name="desc")
@@ -436,9 +746,11 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
                     "form-data", name="file", filename=filename
                 )
                 # send request
-                return await self._prv1(
-                    aiohttp.hdrs.METH_POST, "/fileops/upload", data=mp
+                return await self.printer_request(
+                    aiohttp.hdrs.METH_POST, "/v1/fileops/upload", data=mp
                 )
+        finally:
+            file.close()
 
     async def download_image(
         self, data_path: str, width: int | None = None, height: int | None = None
@@ -447,45 +759,94 @@ class Raise3DPrinterAPI(Raise3DAPIBase):
             height = width or 32
         if width is None:
             width = height
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_GET,
-            "/fileops/imagedownload",
+            "/v1/fileops/imagedownload",
             params={"data_path": data_path, "width": width, "height": height},
         )
 
     async def list_directory(
         self, directory_path: str = "Local/", start_pos: int = 0, max_num: int = 24
     ) -> APIDataResponse:
-        return await self._prv1(
+        return await self.printer_request(
             aiohttp.hdrs.METH_GET,
-            "/fileops/list",
+            "/v1/fileops/list",
             params={"dir": directory_path, "start_pos": start_pos, "max_num": max_num},
         )
 
 
 class Raise3DStatefulPrinterAPI(Raise3DPrinterAPI):
     def __init__(
-        self, *args, printer_password: str, printer_auto_auth: bool = True, **kwargs
+        self,
+        *args,
+        printer_password: str,
+        printer_auto_auth: bool = True,
+        printer_token_ttl: float | None = DEFAULT_TOKEN_TTL,
+        **kwargs,
     ) -> None:
         self.printer_password = printer_password
         self.printer_auto_auth = printer_auto_auth
+        self.printer_token_ttl = printer_token_ttl
+        self._token_renew_at: float | None = None
+        self._login_lock = asyncio.Lock()
         super().__init__(*args, **kwargs)
 
+    @property
+    def printer_password(self) -> str:
+        return self._printer_password
+
+    @printer_password.setter
+    def printer_password(self, printer_password: str) -> None:
+        self._printer_password = printer_password
+        # Hash object fed with the password, kept along with its algorithm
+        self._sign_hash_base: tuple[SignAlgorithmValue, Any] | None = None
+
     async def login(
         self, sign: str | None = None, timestamp: int | None = None, **kwargs
     ) -> APIDataResponse:
         if timestamp is None and sign is not None:
             raise ValueError("signature provided without timestamp")
-        sign, timestamp = self.generate_sign(self.printer_password)
+        if (hash_base := self._sign_hash_base) is None or hash_base[
+            0
+        ] != self.sign_algo:
+            hash_base = self._sign_hash_base = (
+                self.sign_algo,
+                _new_sign_hash_base(self.printer_password, self.sign_algo),
+            )
+        sign, timestamp = self.generate_sign(
+            self.printer_password, algorithm=self.sign_algo, hash_base=hash_base[1]
+        )
         response_data = await super().login(sign, timestamp, auto_auth=False, **kwargs)
         self.printer_token = response_data["token"]
+        if self.printer_token_ttl:
+            self._token_renew_at = (
+                time.monotonic() + self.printer_token_ttl - _TOKEN_RENEW_MARGIN
+            )
         return response_data
 
+    async def _async_renew_token(self) -> None:
+        async with self._login_lock:
+            # Concurrent requests may have waited for another renewal
+            if (
+                self._token_renew_at is not None
+                and time.monotonic() >= self._token_renew_at
+            ):
+                self.logger.debug("Authentication token is due, renewing...")
+                await self.login()
+
     async def printer_request(
         self, *args, auto_auth: bool | None = None, **kwargs
     ) -> APIDataResponse:
         if auto_auth is None:
             auto_auth = self.printer_auto_auth
+        if (
+            auto_auth
+            and self._token_renew_at is not None
+            and time.monotonic() >= self._token_renew_at
+            and kwargs.get("auth", True)
+        ):
+            # Renew ahead of expiry instead of failing a request with 401
+            await self._async_renew_token()
         try:
             return await super().printer_request(*args, **kwargs)
         except aiohttp.ClientResponseError as exc:  # @TODO: check authentication
@@ -533,9 +894,9 @@ class Raise3DHostBasedAPIBase(Raise3DAPIBase):
             "printer_url" not in kwargs
         ), "printer_url cannot be provided in host mode"
         assert "camera_url" not in kwargs, "camera_url cannot be provided in host mode"
-        if isinstance(host, IPv4Address):
-            host = str(host.ip if hasattr(host, "ip") else host)
-        self.host = host
+        self.host = str(host) if isinstance(host, IPv4Address) else host
+        # noinspection HttpUrlsUsage
+        self._base_url = f"http://{self.host}"
         self.camera_port = camera_port
         self.printer_port = printer_port
         super().__init__(
@@ -551,8 +912,7 @@ class Raise3DHostBasedAPIBase(Raise3DAPIBase):
     @camera_port.setter
     def camera_port(self, camera_port: int) -> None:
         self._camera_port = camera_port
-        # noinspection HttpUrlsUsage
-        self.camera_url = f"http://{self.host}:{self._camera_port}"
+        self.camera_url = f"{self._base_url}:{self._camera_port}"
 
     @final
     @property
@@ -563,8 +923,7 @@ class Raise3DHostBasedAPIBase(Raise3DAPIBase):
     @printer_port.setter
     def printer_port(self, printer_port: int) -> None:
         self._printer_port = printer_port
-        # noinspection HttpUrlsUsage
-        self.printer_url = f"http://{self.host}:{self._printer_port}"
+        self.printer_url = f"{self._base_url}:{self._printer_port}"
 
 
 class Raise3DHostBasedStatefulAPI(Raise3DHostBasedAPIBase, Raise3DStatefulAPI):
@@ -1,13 +1,14 @@
-import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Callable, Any, Mapping, Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Any, Final, Mapping, Sequence
 
 from homeassistant.components.button import ButtonEntityDescription, ButtonEntity
 
 from custom_components.raise3d import (
+    resolve_api_method_name,
     make_platform_async_setup_entry,
-    wrap_convert_unempty,
+    convert_unempty_float,
     Raise3DEntity,
     Raise3DEntityDescription,
 )
@@ -15,6 +16,9 @@ from custom_components.raise3d.api import Raise3DPrinterAPI, JobActionValue
 
 _LOGGER = logging.getLogger(__name__)
 
+_EMPTY_KEYWORDS: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_POSITIONALS: Sequence[Any] = ()
+
 
 @dataclass(frozen=True, kw_only=True)
 class Raise3DButtonEntityDescription(Raise3DEntityDescription, ButtonEntityDescription):
@@ -23,39 +27,49 @@ class Raise3DButtonEntityDescription(Raise3DEntityDescription, ButtonEntityDescr
     button_method_name: str
     """Method to call when the button is pressed."""
 
-    button_method_keywords: Mapping[str, Any] | None = None
-    button_method_positionals: Sequence[Any] | None = None
+    button_method_keywords: Mapping[str, Any] = field(
+        default_factory=lambda: _EMPTY_KEYWORDS
+    )
+    button_method_positionals: Sequence[Any] = _EMPTY_POSITIONALS
 
-    converter: Callable[[Any], float | None] = wrap_convert_unempty(float)
+    converter: Callable[[Any], float | None] = convert_unempty_float
 
     def __post_init__(self):
         super().__post_init__()
-        if isinstance(self.button_method_name, Callable):
-            object.__setattr__(
-                self, "button_method_name", self.button_method_name.__name__
-            )
+        object.__setattr__(
+            self, "button_method_name", resolve_api_method_name(self.button_method_name)
+        )
 
 
 class Raise3DButtonEntity(Raise3DEntity[Raise3DButtonEntityDescription], ButtonEntity):
     """A class that represents a Raise3D number entity."""
 
-    def press(self) -> None:
-        """Set new value."""
-        return asyncio.run_coroutine_threadsafe(
-            self.async_press(), self.hass.loop
-        ).result()
+    __slots__ = ("_button_method",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._button_method = getattr(
+            self.raise3d_api, self.entity_description.button_method_name
+        )
 
     async def async_press(self) -> None:
         """Set new value."""
-        await self.async_call_method_by_name(
-            self.entity_description.button_method_name,
-            *(self.entity_description.button_method_positionals or ()),
-            **(self.entity_description.button_method_keywords or {}),
+        await self.async_call_method(
+            self._button_method,
+            *self.entity_description.button_method_positionals,
+            **self.entity_description.button_method_keywords,
         )
 
 
+AXES: Final[dict[str, tuple[str, str]]] = {
+    "x": ("left", "right"),  # Negative: left, Positive: right
+    "y": ("backward", "forward"),  # Negative: backward, Positive: forward
+    "z": ("down", "up"),  # Negative: down, Positive: up
+}
+"""Relative movement directions per axis, negative first."""
+
 # noinspection PyArgumentList
-ENTITY_DESCRIPTIONS = [
+ENTITY_DESCRIPTIONS = (
     Raise3DButtonEntityDescription(
         key="recover_last_job",
         icon="mdi:restart",
@@ -67,39 +81,33 @@ ENTITY_DESCRIPTIONS = [
         icon="mdi:home",
         button_method_name=Raise3DPrinterAPI.move_home,
     ),
-]
-
-for axis, directions in {
-    "x": ("left", "right"),  # Negative: left, Positive: right
-    "y": ("backward", "forward"),  # Negative: backward, Positive: forward
-    "z": ("down", "up"),  # Negative: down, Positive: up
-}.items():
-    for i, direction in enumerate(directions, start=0):
-        # noinspection PyArgumentList
-        ENTITY_DESCRIPTIONS.append(
-            Raise3DButtonEntityDescription(
-                key=f"move_{'positive' if i else 'negative'}_{axis}",
-                name=f"Relative move {direction}",
-                icon="mdi:cursor-move",
-                button_method_name=Raise3DPrinterAPI.axis_control,
-                button_method_keywords={
+    *(
+        Raise3DButtonEntityDescription(
+            key=f"move_{'positive' if i else 'negative'}_{axis}",
+            name=f"Relative move {direction}",
+            icon="mdi:cursor-move",
+            button_method_name=Raise3DPrinterAPI.axis_control,
+            button_method_keywords=MappingProxyType(
+                {
                     axis: 1 if i else -1,
                     "is_relative_pos": True,
-                },
-            )
+                }
+            ),
         )
-
-for action in JobActionValue:
-    # noinspection PyArgumentList
-    ENTITY_DESCRIPTIONS.append(
+        for axis, directions in AXES.items()
+        for i, direction in enumerate(directions)
+    ),
+    *(
         Raise3DButtonEntityDescription(
             key=f"job_action_{action.name.lower()}",
             name=f"{action.name.title()} current job",
             icon=f"mdi:{'play' if action == JobActionValue.RESUME else action.name.lower()}",
             button_method_name=Raise3DPrinterAPI.set_current_job,
-            button_method_positionals=[action.value],
+            button_method_positionals=(action.value,),
         )
-    )
+        for action in JobActionValue
+    ),
+)
 
 async_setup_entry = make_platform_async_setup_entry(
     ENTITY_DESCRIPTIONS, Raise3DButtonEntity, _LOGGER
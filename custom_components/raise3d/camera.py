@@ -9,9 +9,11 @@ __all__ = (
     "Raise3DCameraEntityDescription",
 )
 
-import asyncio
 import logging
 from dataclasses import dataclass
+from datetime import timedelta
+from typing import Final
+
 from aiohttp import ClientTimeout
 
 from homeassistant.components.camera import (
@@ -20,6 +22,7 @@ from homeassistant.components.camera import (
     CameraEntityDescription,
 )
 from homeassistant.helpers.aiohttp_client import async_aiohttp_proxy_web
+from homeassistant.util.dt import utcnow
 
 from custom_components.raise3d import (
     Raise3DCoordinatorEntity,
@@ -31,6 +34,9 @@ from custom_components.raise3d.const import DEFAULT_MANUFACTURER
 
 _LOGGER = logging.getLogger(__name__)
 
+STREAM_SOURCE_MAX_DATA_AGE: Final = timedelta(seconds=5)
+"""Age of coordinator data after which stream source requests refresh it."""
+
 
 @dataclass(frozen=True, kw_only=True)
 class Raise3DCameraEntityDescription(
@@ -47,14 +53,6 @@ class Raise3DCamera(Raise3DCoordinatorEntity[Raise3DCameraEntityDescription], Ca
         super().__init__(*args, **kwargs)
         Camera.__init__(self)
 
-    def camera_image(
-        self, width: int | None = None, height: int | None = None
-    ) -> bytes | None:
-        """Return bytes of camera image."""
-        return asyncio.run_coroutine_threadsafe(
-            self.async_camera_image(width, height), self.hass.loop
-        ).result()
-
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
@@ -89,16 +87,23 @@ class Raise3DCamera(Raise3DCoordinatorEntity[Raise3DCameraEntityDescription], Ca
 
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
-        await self.coordinator.async_request_refresh()
         if not (
-            self.coordinator.data and self.coordinator.data.get("is_camera_connected")
+            self.coordinator.last_update_success
+            and (last_update := self.coordinator.last_update_success_time)
+            and utcnow() - last_update < STREAM_SOURCE_MAX_DATA_AGE
+        ):
+            await self.coordinator.async_request_refresh()
+        if not (
+            (data := self.coordinator.data)
+            and (data := data.get(self.entity_description.update_method_name))
+            and data.get("is_camera_connected")
         ):
             return None
         return self.coordinator.raise3d_api.camera_stream_url
 
     def _process_coordinator_data(self, data: APIDataResponse) -> None:
         # Since there is a single camera entity, we can just check if the camera is connected
-        self._attr_available = bool(self.coordinator.data.get("is_camera_connected"))
+        self._attr_available = bool(data.get("is_camera_connected"))
         super()._process_coordinator_data(data)
         if self.stream:
             # @TODO: formatted this way in case we need to do something with
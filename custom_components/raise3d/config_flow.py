@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import aiohttp
@@ -19,6 +20,9 @@ from custom_components.raise3d.const import (
     CONF_PASSWORD,
 )
 
+PROBE_TIMEOUT = 10
+"""Seconds given to the printer to accept entered configuration."""
+
 CONFIG_FLOW_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): cv.string,
@@ -38,6 +42,30 @@ class Raise3DFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     MINOR_VERSION = 2
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        super().__init__()
+        # Kept per flow, so that entered passwords do not outlive it
+        self._suggested_schemas: dict[frozenset, vol.Schema] = {}
+
+    def _get_suggested_schema(self, user_input: dict[str, Any]) -> vol.Schema:
+        """Get configuration schema suggesting previously entered values."""
+        key = frozenset(
+            (field, user_input.get(field)) for field in CONFIG_FLOW_SCHEMA.schema
+        )
+        if (schema := self._suggested_schemas.get(key)) is None:
+            schema = self._suggested_schemas[key] = self.add_suggested_values_to_schema(
+                CONFIG_FLOW_SCHEMA, user_input
+            )
+        return schema
+
+    async def _async_probe(self, user_input: dict[str, Any]) -> dict[str, Any]:
+        """Log in to the printer and fetch its system information."""
+        raise3d_api = await async_initialize_api_from_configuration(
+            self.hass, user_input
+        )
+        return await raise3d_api.get_system_info()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
@@ -47,15 +75,16 @@ class Raise3DFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                raise3d_api = await async_initialize_api_from_configuration(
-                    self.hass, user_input
+                system_info = await asyncio.wait_for(
+                    self._async_probe(user_input), PROBE_TIMEOUT
                 )
-                system_info = await raise3d_api.get_system_info()
             except aiohttp.ClientError as exc:
                 if isinstance(exc, aiohttp.ClientResponseError) and exc.status == 401:
                     errors[CONF_PASSWORD] = "invalid_password"
                 else:
                     errors[CONF_HOST] = "connection_error"
+            except asyncio.TimeoutError:
+                errors[CONF_HOST] = "connection_error"
             else:
                 await self.async_set_unique_id(system_info["machine_id"])
                 self._abort_if_unique_id_configured()
@@ -65,7 +94,7 @@ class Raise3DFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     title=system_info["machine_name"], data=user_input
                 )
 
-            schema = self.add_suggested_values_to_schema(schema, user_input)
+            schema = self._get_suggested_schema(user_input)
 
         # noinspection PyTypeChecker
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
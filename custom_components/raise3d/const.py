@@ -12,3 +12,26 @@ CONF_PORT = "conf_port"
 CONF_PASSWORD = "conf_password"
 
 DEFAULT_MANUFACTURER = "Raise3D"
+
+# API methods polled together by a single coordinator, keyed by group name.
+# Methods not listed here receive a coordinator of their own.
+BULK_UPDATE_GROUPS: dict[str, tuple[str, ...]] = {
+    "information": (
+        "get_system_info",
+        "get_camera_info",
+        "get_statistics",
+    ),
+    "state": (
+        "get_running_status",
+        "get_basic_info",
+        "get_current_job",
+        "get_left_nozzle_info",
+        "get_right_nozzle_info",
+    ),
+}
+
+# Minimum polling intervals (in seconds) of groups holding slow-changing data.
+# Groups not listed here are polled at the configured scan interval.
+BULK_UPDATE_GROUP_MIN_INTERVALS: dict[str, int] = {
+    "information": 300,
+}
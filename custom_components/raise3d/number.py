@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from dataclasses import dataclass
 from typing import Callable, Any
@@ -11,10 +10,11 @@ from homeassistant.components.number import (
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
 
 from custom_components.raise3d import (
+    resolve_api_method_name,
     Raise3DCoordinatorEntity,
     Raise3DCoordinatorEntityDescription,
     make_platform_async_setup_entry,
-    wrap_convert_unempty,
+    convert_unempty_float,
 )
 from custom_components.raise3d.api import Raise3DPrinterAPI
 
@@ -30,14 +30,13 @@ class Raise3DNumberEntityDescription(
     commit_method_name: str
     """Method to call when the number is committed."""
 
-    converter: Callable[[Any], float | None] = wrap_convert_unempty(float)
+    converter: Callable[[Any], float | None] = convert_unempty_float
 
     def __post_init__(self):
         super().__post_init__()
-        if isinstance(self.commit_method_name, Callable):
-            object.__setattr__(
-                self, "commit_method_name", self.commit_method_name.__name__
-            )
+        object.__setattr__(
+            self, "commit_method_name", resolve_api_method_name(self.commit_method_name)
+        )
 
 
 class Raise3DNumberEntity(
@@ -45,20 +44,39 @@ class Raise3DNumberEntity(
 ):
     """A class that represents a Raise3D number entity."""
 
-    def set_native_value(self, value: float) -> None:
-        """Set new value."""
-        return asyncio.run_coroutine_threadsafe(
-            self.async_set_native_value(value), self.hass.loop
-        ).result()
+    __slots__ = ("_commit_method",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._commit_method = getattr(
+            self.raise3d_api, self.entity_description.commit_method_name
+        )
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        await self.async_call_method_by_name(
-            self.entity_description.commit_method_name, value
+        await self.async_call_method(self._commit_method, value)
+        # Printers apply new values with a delay, so show the requested one
+        # right away and poll once consecutive edits have settled.
+        self.coordinator.async_set_optimistic_value(
+            self._update_method_name, self._attribute, value
         )
-        await asyncio.sleep(1.5)
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_reconcile_refresh()
+
 
+_NOZZLES = (
+    (
+        "LN",
+        Raise3DPrinterAPI.get_left_nozzle_info,
+        Raise3DPrinterAPI.set_left_nozzle_flowrate,
+        Raise3DPrinterAPI.set_left_nozzle_temp,
+    ),
+    (
+        "RN",
+        Raise3DPrinterAPI.get_right_nozzle_info,
+        Raise3DPrinterAPI.set_right_nozzle_flowrate,
+        Raise3DPrinterAPI.set_right_nozzle_temp,
+    ),
+)
 
 # noinspection PyArgumentList
 ENTITY_DESCRIPTIONS = [
@@ -84,18 +102,7 @@ ENTITY_DESCRIPTIONS = [
     ),
 ]
 
-for prefix, (update_method, commit_flowrate, commit_temp) in {
-    "LN": (
-        Raise3DPrinterAPI.get_left_nozzle_info,
-        Raise3DPrinterAPI.set_left_nozzle_flowrate,
-        Raise3DPrinterAPI.set_left_nozzle_temp,
-    ),
-    "RN": (
-        Raise3DPrinterAPI.get_right_nozzle_info,
-        Raise3DPrinterAPI.set_right_nozzle_flowrate,
-        Raise3DPrinterAPI.set_right_nozzle_temp,
-    ),
-}.items():
+for prefix, update_method, commit_flowrate, commit_temp in _NOZZLES:
     # noinspection PyArgumentList
     ENTITY_DESCRIPTIONS.extend(
         [
@@ -35,6 +35,8 @@ from custom_components.raise3d import (
     Raise3DCoordinatorEntityDescription,
     make_platform_async_setup_entry,
     wrap_convert_unempty,
+    convert_unempty_int,
+    convert_unempty_float,
 )
 from custom_components.raise3d.api import (
     Raise3DPrinterAPI,
@@ -54,6 +56,33 @@ OCTOPRINT_STATUS_MAPPING = {
 }
 
 
+def _parse_date_time(value: str) -> datetime:
+    # Printers report 'YYYY-MM-DD HH:MM:SS', which is parsed at fixed offsets
+    if len(value) != 19:
+        return datetime.fromisoformat(value).replace(tzinfo=UTC)
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        tzinfo=UTC,
+    )
+
+
+def _map_octoprint_status(value: str) -> str:
+    return OCTOPRINT_STATUS_MAPPING.get(value, "Unknown State")
+
+
+_RUNNING_STATUS_OPTIONS = tuple(status.value for status in RunningStatusValue)
+_JOB_STATUS_OPTIONS = tuple(status.value for status in JobStatusValue)
+_OCTOPRINT_STATUS_OPTIONS = tuple(OCTOPRINT_STATUS_MAPPING.values())
+
+_CONVERT_DATE_TIME = wrap_convert_unempty(_parse_date_time)
+_CONVERT_OCTOPRINT_STATUS = wrap_convert_unempty(_map_octoprint_status)
+
+
 @dataclass(frozen=True, kw_only=True)
 class Raise3DSensorEntityDescription(
     Raise3DCoordinatorEntityDescription, SensorEntityDescription
@@ -62,7 +91,7 @@ class Raise3DSensorEntityDescription(
 
 
 # noinspection PyArgumentList
-ED_PRINTER_SYSTEM_INFORMATION = [
+ED_PRINTER_SYSTEM_INFORMATION = (
     Raise3DSensorEntityDescription(
         key="Serial_number",
         icon="mdi:numeric",
@@ -84,22 +113,20 @@ ED_PRINTER_SYSTEM_INFORMATION = [
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        converter=wrap_convert_unempty(float),
+        converter=convert_unempty_float,
     ),
     Raise3DSensorEntityDescription(
         key="brightness",
         icon="mdi:brightness-6",
         update_method_name=Raise3DPrinterAPI.get_system_info,
-        converter=wrap_convert_unempty(int),
+        converter=convert_unempty_int,
     ),
     Raise3DSensorEntityDescription(
         key="date_time",
         icon="mdi:calendar-clock",
         update_method_name=Raise3DPrinterAPI.get_system_info,
         device_class=SensorDeviceClass.TIMESTAMP,
-        converter=wrap_convert_unempty(
-            lambda x: datetime.strptime(x, "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC)
-        ),
+        converter=_CONVERT_DATE_TIME,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
     Raise3DSensorEntityDescription(
@@ -167,10 +194,10 @@ ED_PRINTER_SYSTEM_INFORMATION = [
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-]
+)
 
 # noinspection PyArgumentList
-ED_CAMERA_INFORMATION = [
+ED_CAMERA_INFORMATION = (
     Raise3DSensorEntityDescription(
         key="camerserver_URI",
         icon="mdi:ip-network-outline",
@@ -190,16 +217,16 @@ ED_CAMERA_INFORMATION = [
     #         icon="mdi:account",
     #         update_method_name=Raise3DPrinterAPI.get_camera_info,
     #     ),
-]
+)
 
 # noinspection PyArgumentList
-ED_PRINTER_RUNNING_STATUS = [
+ED_PRINTER_RUNNING_STATUS = (
     Raise3DSensorEntityDescription(
         key="running_status",
         icon="mdi:state-machine",
         update_method_name=Raise3DPrinterAPI.get_running_status,
         device_class=SensorDeviceClass.ENUM,
-        options=[status.value for status in RunningStatusValue],
+        options=_RUNNING_STATUS_OPTIONS,
     ),
     # OctoPrint compatibility
     Raise3DSensorEntityDescription(
@@ -207,17 +234,15 @@ ED_PRINTER_RUNNING_STATUS = [
         attribute="running_status",
         icon="mdi:state-machine",
         update_method_name=Raise3DPrinterAPI.get_running_status,
-        converter=wrap_convert_unempty(
-            lambda x: OCTOPRINT_STATUS_MAPPING.get(x, "Unknown State")
-        ),
+        converter=_CONVERT_OCTOPRINT_STATUS,
         device_class=SensorDeviceClass.ENUM,
-        options=list(OCTOPRINT_STATUS_MAPPING.values()),
+        options=_OCTOPRINT_STATUS_OPTIONS,
         entity_registry_enabled_default=False,
     ),
-]
+)
 
 # noinspection PyArgumentList
-ED_PRINTER_BASIC_INFORMATION = [
+ED_PRINTER_BASIC_INFORMATION = (
     Raise3DSensorEntityDescription(
         key="fan_cur_speed",
         icon="mdi:fan",
@@ -254,53 +279,54 @@ ED_PRINTER_BASIC_INFORMATION = [
     #     state_class=SensorStateClass.MEASUREMENT,
     #     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     # ),
-]
-
-ED_NOZZLE_INFORMATION = []
-
-for prefix, update_method in {
-    "LN": Raise3DPrinterAPI.get_left_nozzle_info,
-    "RN": Raise3DPrinterAPI.get_right_nozzle_info,
-}.items():
-    # noinspection PyArgumentList
-    ED_NOZZLE_INFORMATION.extend(
-        [
-            Raise3DSensorEntityDescription(
-                key=f"{prefix}_flow_cur_rate",
-                attribute="flow_cur_rate",
-                icon="mdi:printer-3d-nozzle-outline",
-                update_method_name=update_method,
-                state_class=SensorStateClass.MEASUREMENT,
-                native_unit_of_measurement=PERCENTAGE,
-            ),
-            # Raise3DSensorEntityDescription(
-            #     key=f"{prefix}_flow_tar_rate",
-            #     attribute="flow_tar_rate",
-            #     icon="mdi:printer-3d-nozzle-outline",
-            #     update_method_name=update_method,
-            #     state_class=SensorStateClass.MEASUREMENT,
-            #     native_unit_of_measurement=PERCENTAGE,
-            # ),
-            Raise3DSensorEntityDescription(
-                key=f"{prefix}_nozzle_cur_temp",
-                attribute="nozzle_cur_temp",
-                icon="mdi:printer-3d-nozzle-heat",
-                update_method_name=update_method,
-                device_class=SensorDeviceClass.TEMPERATURE,
-                state_class=SensorStateClass.MEASUREMENT,
-                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            ),
-            # Raise3DSensorEntityDescription(
-            #     key=f"{prefix}_nozzle_tar_temp",
-            #     attribute="nozzle_tar_temp",
-            #     icon="mdi:printer-3d-nozzle-heat",
-            #     update_method_name=update_method,
-            #     device_class=SensorDeviceClass.TEMPERATURE,
-            #     state_class=SensorStateClass.MEASUREMENT,
-            #     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            # ),
-        ]
+)
+
+_NOZZLES = (
+    ("LN", Raise3DPrinterAPI.get_left_nozzle_info),
+    ("RN", Raise3DPrinterAPI.get_right_nozzle_info),
+)
+
+# noinspection PyArgumentList
+ED_NOZZLE_INFORMATION = tuple(
+    description
+    for prefix, update_method in _NOZZLES
+    for description in (
+        Raise3DSensorEntityDescription(
+            key=f"{prefix}_flow_cur_rate",
+            attribute="flow_cur_rate",
+            icon="mdi:printer-3d-nozzle-outline",
+            update_method_name=update_method,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=PERCENTAGE,
+        ),
+        # Raise3DSensorEntityDescription(
+        #     key=f"{prefix}_flow_tar_rate",
+        #     attribute="flow_tar_rate",
+        #     icon="mdi:printer-3d-nozzle-outline",
+        #     update_method_name=update_method,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     native_unit_of_measurement=PERCENTAGE,
+        # ),
+        Raise3DSensorEntityDescription(
+            key=f"{prefix}_nozzle_cur_temp",
+            attribute="nozzle_cur_temp",
+            icon="mdi:printer-3d-nozzle-heat",
+            update_method_name=update_method,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        ),
+        # Raise3DSensorEntityDescription(
+        #     key=f"{prefix}_nozzle_tar_temp",
+        #     attribute="nozzle_tar_temp",
+        #     icon="mdi:printer-3d-nozzle-heat",
+        #     update_method_name=update_method,
+        #     device_class=SensorDeviceClass.TEMPERATURE,
+        #     state_class=SensorStateClass.MEASUREMENT,
+        #     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        # ),
     )
+)
 
 
 def _extrapolate_remaining_time(data: APIDataResponse) -> float:
@@ -315,7 +341,7 @@ def _extrapolate_remaining_time(data: APIDataResponse) -> float:
 
 
 # noinspection PyArgumentList
-ED_PRINTER_CURRENT_JOB_INFORMATION = [
+ED_PRINTER_CURRENT_JOB_INFORMATION = (
     Raise3DSensorEntityDescription(
         key="file_name",
         icon="mdi:file-outline",
@@ -375,13 +401,13 @@ ED_PRINTER_CURRENT_JOB_INFORMATION = [
         icon="mdi:bell-circle-outline",
         update_method_name=Raise3DPrinterAPI.get_current_job,
         device_class=SensorDeviceClass.ENUM,
-        options=[status.value for status in JobStatusValue],
+        options=_JOB_STATUS_OPTIONS,
     ),
-]
+)
 
 
 # noinspection PyArgumentList
-ED_STATISTICS = [
+ED_STATISTICS = (
     Raise3DSensorEntityDescription(
         key="printed_file_num",
         icon="mdi:file-multiple-outline",
@@ -406,7 +432,7 @@ ED_STATISTICS = [
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        converter=wrap_convert_unempty(float),
+        converter=convert_unempty_float,
     ),
     Raise3DSensorEntityDescription(
         key="printed_used_filament_right",
@@ -416,7 +442,7 @@ ED_STATISTICS = [
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        converter=wrap_convert_unempty(float),
+        converter=convert_unempty_float,
     ),
     Raise3DSensorEntityDescription(
         key="printed_used_filament",
@@ -426,19 +452,19 @@ ED_STATISTICS = [
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        converter=wrap_convert_unempty(float),
+        converter=convert_unempty_float,
     ),
-]
+)
 
 
 ENTITY_DESCRIPTIONS = (
-    ED_PRINTER_SYSTEM_INFORMATION
-    + ED_CAMERA_INFORMATION
-    + ED_PRINTER_RUNNING_STATUS
-    + ED_PRINTER_BASIC_INFORMATION
-    + ED_NOZZLE_INFORMATION
-    + ED_PRINTER_CURRENT_JOB_INFORMATION
-    + ED_STATISTICS
+    *ED_PRINTER_SYSTEM_INFORMATION,
+    *ED_CAMERA_INFORMATION,
+    *ED_PRINTER_RUNNING_STATUS,
+    *ED_PRINTER_BASIC_INFORMATION,
+    *ED_NOZZLE_INFORMATION,
+    *ED_PRINTER_CURRENT_JOB_INFORMATION,
+    *ED_STATISTICS,
 )
 
 
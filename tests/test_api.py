@@ -0,0 +1,196 @@
+"""Tests for GET response caching and coalescing of the printer API."""
+
+import asyncio
+import types
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")
+
+from custom_components.raise3d import api
+from custom_components.raise3d.api import Raise3DPrinterAPI
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _FakeClock:
+    fake_clock = _FakeClock()
+    # Only the API module sees the fake clock, the event loop keeps its own
+    monkeypatch.setattr(
+        api, "time", types.SimpleNamespace(monotonic=fake_clock.monotonic)
+    )
+    return fake_clock
+
+
+@pytest.fixture
+def printer_api(monkeypatch) -> Raise3DPrinterAPI:
+    printer_api = Raise3DPrinterAPI(
+        printer_url="http://printer:10800",
+        printer_token="token",
+        session=object(),
+        cache_ttl=2.0,
+    )
+    printer_api.calls = []
+
+    async def _printer_request(method, endpoint, params=None, *args):
+        printer_api.calls.append((method, endpoint, params))
+        return {"endpoint": endpoint, "call": len(printer_api.calls)}
+
+    monkeypatch.setattr(printer_api, "_printer_request", _printer_request)
+    return printer_api
+
+
+def _gate_requests(printer_api: Raise3DPrinterAPI) -> asyncio.Event:
+    """Hold printer requests until the returned event is set."""
+    original_request = printer_api._printer_request
+    released = asyncio.Event()
+
+    async def _printer_request(*args):
+        await released.wait()
+        return await original_request(*args)
+
+    printer_api._printer_request = _printer_request
+    return released
+
+
+def test_get_served_from_cache(clock, printer_api):
+    async def _test():
+        first = await printer_api.printer_request("GET", "/v1/info")
+        second = await printer_api.printer_request("GET", "/v1/info")
+        return first, second
+
+    first, second = asyncio.run(_test())
+
+    assert first == second
+    assert len(printer_api.calls) == 1
+
+
+def test_cached_response_is_copied(clock, printer_api):
+    async def _test():
+        # Both the freshly requested response and cache hits are copies
+        for _ in range(2):
+            response = await printer_api.printer_request("GET", "/v1/info")
+            response["endpoint"] = "changed"
+        return await printer_api.printer_request("GET", "/v1/info")
+
+    assert asyncio.run(_test())["endpoint"] == "/v1/info"
+
+
+def test_cache_expires(clock, printer_api):
+    async def _test():
+        await printer_api.printer_request("GET", "/v1/info")
+        clock.now += 2.0
+        await printer_api.printer_request("GET", "/v1/info")
+
+    asyncio.run(_test())
+
+    assert len(printer_api.calls) == 2
+
+
+def test_expired_responses_pruned(clock, printer_api):
+    async def _test():
+        await printer_api.printer_request("GET", "/v1/info")
+        clock.now += 2.0
+        await printer_api.printer_request("GET", "/v1/status")
+
+    asyncio.run(_test())
+
+    assert [key[0] for key in printer_api._response_cache] == ["/v1/status"]
+
+
+def test_cursor_requests_not_cached(clock, printer_api):
+    async def _test():
+        for _ in range(2):
+            await printer_api.printer_request("GET", "/v1/log", {"start_pos": 0})
+
+    asyncio.run(_test())
+
+    assert len(printer_api.calls) == 2
+    assert not printer_api._response_cache
+
+
+def test_concurrent_gets_coalesced(clock, printer_api):
+    async def _test():
+        released = _gate_requests(printer_api)
+        tasks = [
+            asyncio.create_task(printer_api.printer_request("GET", "/v1/info"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        released.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(_test())
+
+    assert len(printer_api.calls) == 1
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+
+
+def test_cancelled_waiter_does_not_cancel_shared_request(clock, printer_api):
+    async def _test():
+        released = _gate_requests(printer_api)
+        cancelled = asyncio.create_task(printer_api.printer_request("GET", "/v1/info"))
+        waiting = asyncio.create_task(printer_api.printer_request("GET", "/v1/info"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        released.set()
+        return await waiting
+
+    assert asyncio.run(_test())["endpoint"] == "/v1/info"
+    assert len(printer_api.calls) == 1
+
+
+def test_write_invalidates_cache(clock, printer_api):
+    async def _test():
+        await printer_api.printer_request("GET", "/v1/info")
+        await printer_api.printer_request("POST", "/v1/job/pause")
+        await printer_api.printer_request("GET", "/v1/info")
+
+    asyncio.run(_test())
+
+    assert [call[:2] for call in printer_api.calls] == [
+        ("GET", "/v1/info"),
+        ("POST", "/v1/job/pause"),
+        ("GET", "/v1/info"),
+    ]
+
+
+def test_write_detaches_inflight_get(clock, printer_api):
+    async def _test():
+        released = _gate_requests(printer_api)
+        stale = asyncio.create_task(printer_api.printer_request("GET", "/v1/info"))
+        await asyncio.sleep(0)
+        write = asyncio.create_task(
+            printer_api.printer_request("POST", "/v1/job/pause")
+        )
+        await asyncio.sleep(0)
+        fresh = asyncio.create_task(printer_api.printer_request("GET", "/v1/info"))
+        await asyncio.sleep(0)
+        released.set()
+        await asyncio.gather(stale, write, fresh)
+
+    asyncio.run(_test())
+
+    # Read issued after the write neither joins nor caches the earlier read
+    assert [call[:2] for call in printer_api.calls].count(("GET", "/v1/info")) == 2
+    assert not printer_api._response_cache
+
+
+def test_invalidate_by_prefix(clock, printer_api):
+    async def _test():
+        await printer_api.printer_request("GET", "/v1/job/currentjob")
+        await printer_api.printer_request("GET", "/v1/printer/system")
+        printer_api.invalidate("/v1/job/")
+
+    asyncio.run(_test())
+
+    assert [key[0] for key in printer_api._response_cache] == ["/v1/printer/system"]
@@ -0,0 +1,124 @@
+"""Tests for API call retries performed by the integration."""
+
+import asyncio
+import logging
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")
+
+from custom_components.raise3d import _async_call_api_method
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _FlakyMethod:
+    """API method failing with given errors before returning a result."""
+
+    __name__ = "flaky_method"
+
+    def __init__(self, *errors: BaseException) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"args": args, "kwargs": kwargs}
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    delays = []
+
+    async def _sleep(delay, *args, **kwargs):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+    return delays
+
+
+def _too_many_requests(retry_after: str | None = None):
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return aiohttp.ClientResponseError(None, (), status=429, headers=headers)
+
+
+def test_idempotent_call_retried_after_disconnect(sleeps):
+    method = _FlakyMethod(aiohttp.ServerDisconnectedError())
+
+    result = asyncio.run(_async_call_api_method(method, _LOGGER, 1, key="value"))
+
+    assert result == {"args": (1,), "kwargs": {"key": "value"}}
+    assert method.calls == 2
+    assert len(sleeps) == 1
+
+
+def test_idempotent_call_retried_after_connection_reset(sleeps):
+    method = _FlakyMethod(aiohttp.ClientOSError(104, "Connection reset by peer"))
+
+    asyncio.run(_async_call_api_method(method))
+
+    assert method.calls == 2
+
+
+def test_other_connection_errors_not_retried(sleeps):
+    method = _FlakyMethod(aiohttp.ClientOSError(113, "No route to host"))
+
+    with pytest.raises(aiohttp.ClientOSError):
+        asyncio.run(_async_call_api_method(method))
+
+    assert method.calls == 1
+    assert not sleeps
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        aiohttp.ServerDisconnectedError(),
+        aiohttp.ClientOSError(104, "Connection reset by peer"),
+    ],
+)
+def test_non_idempotent_call_not_retried_after_disconnect(sleeps, error):
+    method = _FlakyMethod(error)
+
+    with pytest.raises(type(error)):
+        asyncio.run(_async_call_api_method(method, idempotent=False))
+
+    assert method.calls == 1
+    assert not sleeps
+
+
+def test_non_idempotent_call_retried_after_too_many_requests(sleeps):
+    method = _FlakyMethod(_too_many_requests())
+
+    asyncio.run(_async_call_api_method(method, idempotent=False))
+
+    assert method.calls == 2
+
+
+def test_too_many_requests_honours_retry_after(sleeps):
+    method = _FlakyMethod(_too_many_requests("3"))
+
+    asyncio.run(_async_call_api_method(method))
+
+    assert sleeps == [3.0]
+
+
+def test_retry_delay_capped_by_timeout(sleeps):
+    method = _FlakyMethod(_too_many_requests("60"))
+
+    asyncio.run(_async_call_api_method(method, timeout=4))
+
+    assert sleeps == [2.0]
+
+
+def test_retries_exhausted(sleeps):
+    method = _FlakyMethod(*(aiohttp.ServerDisconnectedError() for _ in range(5)))
+
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        asyncio.run(_async_call_api_method(method))
+
+    assert method.calls == 3
+    assert len(sleeps) == 2